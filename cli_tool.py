@@ -9,7 +9,9 @@ import sys
 import json
 from pathlib import Path
 from datetime import datetime
-from src.utils.helpers import load_json_file, save_json_file, format_file_size
+from src.utils.helpers import (
+    load_json_file, save_json_file, format_file_size, parse_csv_text, parse_ndjson_text
+)
 
 
 def create_task(args):
@@ -146,6 +148,55 @@ def delete_task(args):
         print("❌ Error deleting task")
 
 
+def backfill_oauth_keys(args):
+    """Populate the oauth_key GSI attribute on existing OAuth users."""
+    from src.models.dynamodb_user import db_user
+    
+    try:
+        updated = db_user.backfill_oauth_keys()
+        print(f"✅ Backfilled oauth_key on {updated} user(s)")
+    except Exception as e:
+        print(f"❌ Error backfilling OAuth keys: {e}")
+        sys.exit(1)
+
+
+def backfill_unique_sentinels(args):
+    """Create username/email uniqueness sentinels for existing users."""
+    from src.models.dynamodb_user import db_user
+    
+    try:
+        processed = db_user.backfill_unique_sentinels()
+        print(f"✅ Backfilled uniqueness sentinels for {processed} user(s)")
+    except Exception as e:
+        print(f"❌ Error backfilling sentinels: {e}")
+        sys.exit(1)
+
+
+def import_users(args):
+    """Bulk import users into DynamoDB from a CSV or NDJSON file."""
+    from src.models.dynamodb_user import db_user
+    
+    import_path = Path(args.file)
+    if not import_path.exists():
+        print(f"File not found: {args.file}")
+        sys.exit(1)
+    
+    import_format = args.format or ('csv' if import_path.suffix.lower() == '.csv' else 'ndjson')
+    text = import_path.read_text(encoding='utf-8')
+    
+    try:
+        rows = parse_csv_text(text) if import_format == 'csv' else parse_ndjson_text(text)
+        results = db_user.bulk_create_users(rows, max_in_flight=args.max_in_flight)
+    except Exception as e:
+        print(f"❌ Error importing users: {e}")
+        sys.exit(1)
+    
+    failed = [result for result in results if result['status'] != 'created']
+    print(f"✅ Imported {len(results) - len(failed)} of {len(results)} user(s)")
+    for result in failed:
+        print(f"   ❌ Row {result['row']} ({result['username']}): {result['error']}")
+
+
 def main():
     """Main CLI function."""
     parser = argparse.ArgumentParser(
@@ -158,6 +209,9 @@ Examples:
   python cli_tool.py list --status pending
   python cli_tool.py update 1234567890.123 --status completed
   python cli_tool.py delete 1234567890.123
+  python cli_tool.py backfill-oauth-keys
+  python cli_tool.py backfill-unique-sentinels
+  python cli_tool.py import-users users.csv
         """
     )
     
@@ -187,6 +241,23 @@ Examples:
     delete_parser = subparsers.add_parser('delete', help='Delete a task')
     delete_parser.add_argument('task_id', help='Task ID to delete')
     
+    # Backfill OAuth keys command
+    subparsers.add_parser('backfill-oauth-keys',
+                          help='Populate oauth_key on existing OAuth users (DynamoDB)')
+    
+    # Backfill uniqueness sentinels command
+    subparsers.add_parser('backfill-unique-sentinels',
+                          help='Create username/email sentinels for existing users (DynamoDB)')
+    
+    # Import users command
+    import_parser = subparsers.add_parser('import-users',
+                                          help='Bulk import users into DynamoDB from CSV or NDJSON')
+    import_parser.add_argument('file', help='CSV (with header row) or NDJSON file')
+    import_parser.add_argument('--format', choices=['csv', 'ndjson'],
+                               help='Input format (default: from file extension)')
+    import_parser.add_argument('--max-in-flight', type=int, default=4,
+                               help='Maximum concurrent BatchWriteItem requests')
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -202,6 +273,12 @@ Examples:
         update_task(args)
     elif args.command == 'delete':
         delete_task(args)
+    elif args.command == 'backfill-oauth-keys':
+        backfill_oauth_keys(args)
+    elif args.command == 'backfill-unique-sentinels':
+        backfill_unique_sentinels(args)
+    elif args.command == 'import-users':
+        import_users(args)
 
 
 if __name__ == '__main__':
@@ -28,11 +28,13 @@ aws dynamodb create-table \
         AttributeName=id,AttributeType=S \
         AttributeName=username,AttributeType=S \
         AttributeName=email,AttributeType=S \
+        AttributeName=oauth_key,AttributeType=S \
     --key-schema \
         AttributeName=id,KeyType=HASH \
     --global-secondary-indexes \
         'IndexName=username-index,KeySchema=[{AttributeName=username,KeyType=HASH}],Projection={ProjectionType=ALL},ProvisionedThroughput={ReadCapacityUnits=5,WriteCapacityUnits=5}' \
         'IndexName=email-index,KeySchema=[{AttributeName=email,KeyType=HASH}],Projection={ProjectionType=ALL},ProvisionedThroughput={ReadCapacityUnits=5,WriteCapacityUnits=5}' \
+        'IndexName=oauth-key-index,KeySchema=[{AttributeName=oauth_key,KeyType=HASH}],Projection={ProjectionType=ALL},ProvisionedThroughput={ReadCapacityUnits=5,WriteCapacityUnits=5}' \
     --provisioned-throughput \
         ReadCapacityUnits=5,WriteCapacityUnits=5 \
     --endpoint-url $DYNAMODB_ENDPOINT \
@@ -4,11 +4,48 @@ Replaces SQLAlchemy model for better Lambda performance
 """
 
 import os
+import queue
+import random
+import threading
+import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 import boto3
 from botocore.exceptions import ClientError
+from src.utils.cache import TTLCache
+from src.utils.pagination import encode_cursor, decode_cursor, DEFAULT_PAGE_SIZE
+
+# Segmented scans: default parallelism and how many pages may wait unconsumed
+DEFAULT_SCAN_SEGMENTS = int(os.environ.get('USER_SCAN_SEGMENTS', '4'))
+MAX_SCAN_SEGMENTS = 64
+SCAN_QUEUE_PAGES = 8
+
+_SEGMENT_DONE = object()
+
+# Batch operations: DynamoDB per-request key limit and UnprocessedKeys retries
+BATCH_GET_MAX_KEYS = 100
+BATCH_WRITE_MAX_ITEMS = 25
+BULK_MAX_IN_FLIGHT = 4
+BATCH_MAX_RETRIES = 5
+BATCH_BACKOFF_BASE = 0.05
+
+# Read-through cache for single-user lookups (per warm container)
+USER_CACHE_SIZE = int(os.environ.get('USER_CACHE_SIZE', '1024'))
+USER_CACHE_TTL = float(os.environ.get('USER_CACHE_TTL', '30'))
+
+OAUTH_KEY_INDEX = 'oauth-key-index'
+
+# Uniqueness sentinels live in the users table next to the users they guard.
+# They carry a record_type attribute, which user scans filter out.
+USERNAME_SENTINEL_PREFIX = 'USERNAME#'
+EMAIL_SENTINEL_PREFIX = 'EMAIL#'
+USER_RECORDS_FILTER = 'attribute_not_exists(record_type)'
+
+def make_oauth_key(provider: str, oauth_id: str) -> str:
+    """Build the composite ``oauth_provider#oauth_id`` key used by the OAuth GSI."""
+    return f"{provider}#{oauth_id}"
 
 class DynamoDBUser:
     """User model using DynamoDB for serverless architecture."""
@@ -32,6 +69,92 @@ class DynamoDBUser:
         
         self.table_name = os.environ.get('DYNAMODB_TABLE', 'kelly-user-management-dev-users')
         self.table = self.dynamodb.Table(self.table_name)
+        
+        # Entries are shared between the id, username and email keys of a user
+        self.cache = TTLCache(max_size=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+    
+    def _cache_user(self, user: Dict[str, Any]) -> None:
+        """Cache a user under its id, username and email."""
+        if user.get('id') is not None:
+            self.cache.set(('id', str(user['id'])), user)
+        if user.get('username'):
+            self.cache.set(('username', user['username']), user)
+        if user.get('email'):
+            self.cache.set(('email', user['email']), user)
+    
+    def _cached_user(self, key_type: str, value: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached user, or None on a miss."""
+        user = self.cache.get((key_type, value))
+        return dict(user) if user is not None else None
+    
+    def invalidate_user(self, user_id: Optional[str] = None, username: Optional[str] = None,
+                        email: Optional[str] = None) -> None:
+        """Drop every cache key that may refer to the given user."""
+        keys = set()
+        if user_id is not None:
+            keys.add(('id', str(user_id)))
+            cached = self.cache.peek(('id', str(user_id)))
+            if cached:
+                keys.add(('username', cached.get('username')))
+                keys.add(('email', cached.get('email')))
+        if username:
+            keys.add(('username', username))
+        if email:
+            keys.add(('email', email))
+        
+        for key in keys:
+            self.cache.delete(key)
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters for the user lookup cache."""
+        return self.cache.stats()
+    
+    def _sentinel_item(self, prefix: str, value: str, user_id: str) -> Dict[str, Any]:
+        """Build the sentinel item that reserves a username or email."""
+        return {'id': f"{prefix}{value}", 'record_type': 'unique', 'user_id': str(user_id)}
+    
+    def _put_sentinel(self, prefix: str, value: str, user_id: str) -> Dict[str, Any]:
+        """Transaction step claiming a username/email unless another user holds it."""
+        return {
+            'Put': {
+                'TableName': self.table_name,
+                'Item': self._sentinel_item(prefix, value, user_id),
+                'ConditionExpression': 'attribute_not_exists(id) OR user_id = :user_id',
+                'ExpressionAttributeValues': {':user_id': str(user_id)}
+            }
+        }
+    
+    def _delete_sentinel(self, prefix: str, value: str) -> Dict[str, Any]:
+        """Transaction step releasing a username/email sentinel."""
+        return {'Delete': {'TableName': self.table_name, 'Key': {'id': f"{prefix}{value}"}}}
+    
+    def _put_new_user(self, user_item: Dict[str, Any]) -> Dict[str, Any]:
+        """Transaction step inserting a user item with a fresh id."""
+        return {
+            'Put': {
+                'TableName': self.table_name,
+                'Item': user_item,
+                'ConditionExpression': 'attribute_not_exists(id)'
+            }
+        }
+    
+    def _transact_write(self, transact_items: List[Dict[str, Any]],
+                        conflict_errors: List[Optional[str]]) -> None:
+        """Run TransactWriteItems, mapping failed conditions to ValueErrors.
+        
+        ``conflict_errors`` lines up with ``transact_items``; when a step's
+        condition fails its message is raised as a ValueError.
+        """
+        try:
+            self.dynamodb.meta.client.transact_write_items(TransactItems=transact_items)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') != 'TransactionCanceledException':
+                raise
+            reasons = e.response.get('CancellationReasons', [])
+            for reason, message in zip(reasons, conflict_errors):
+                if message and reason.get('Code') == 'ConditionalCheckFailed':
+                    raise ValueError(message)
+            raise
     
     def to_dict(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Convert DynamoDB item to standard dictionary format."""
@@ -53,20 +176,16 @@ class DynamoDBUser:
         }
     
     def create_user(self, username: str, email: str, first_name: str, last_name: str) -> Dict[str, Any]:
-        """Create a new user in DynamoDB."""
+        """Create a new user in DynamoDB.
+        
+        The user and its username/email sentinels are written in one
+        transaction, so uniqueness holds under concurrent signups.
+        """
         try:
             # Generate unique ID
             user_id = str(uuid.uuid4().int)[:10]  # Use first 10 digits of UUID as integer string
             current_time = datetime.utcnow().isoformat()
             
-            # Check if username already exists
-            if self.get_user_by_username(username):
-                raise ValueError("Username already exists")
-            
-            # Check if email already exists
-            if self.get_user_by_email(email):
-                raise ValueError("Email already exists")
-            
             # Create user item
             user_item = {
                 'id': user_id,
@@ -79,8 +198,16 @@ class DynamoDBUser:
                 'is_active': True
             }
             
-            # Put item in DynamoDB
-            self.table.put_item(Item=user_item)
+            # Write user and uniqueness sentinels atomically
+            self._transact_write(
+                [
+                    self._put_new_user(user_item),
+                    self._put_sentinel(USERNAME_SENTINEL_PREFIX, username, user_id),
+                    self._put_sentinel(EMAIL_SENTINEL_PREFIX, email, user_id)
+                ],
+                [None, "Username already exists", "Email already exists"]
+            )
+            self.invalidate_user(user_id, username=username, email=email)
             
             return self.to_dict(user_item)
             
@@ -91,15 +218,173 @@ class DynamoDBUser:
             print(f"Error creating user: {e}")
             raise e
     
-    def get_all_users(self) -> List[Dict[str, Any]]:
-        """Get all users from DynamoDB."""
+    def bulk_create_users(self, rows: List[Dict[str, Any]],
+                          max_in_flight: int = BULK_MAX_IN_FLIGHT) -> List[Dict[str, Any]]:
+        """Create many users with BatchWriteItem.
+        
+        Rows are validated and checked for duplicate usernames/emails within
+        the batch in memory and against existing sentinels with BatchGetItem,
+        then each user and its two sentinels are written in groups of
+        BATCH_WRITE_MAX_ITEMS items with at most ``max_in_flight`` batches
+        outstanding. BatchWriteItem is not conditional, so a signup racing
+        the import can still claim the same username or email. Returns one
+        result per input row, in input order, with status ``created`` or
+        ``error``.
+        """
+        required_fields = ['username', 'email', 'first_name', 'last_name']
+        results: List[Dict[str, Any]] = []
+        pending: List[Dict[str, Any]] = []
+        seen_usernames = set()
+        seen_emails = set()
+        current_time = datetime.utcnow().isoformat()
+        
+        for row_number, row in enumerate(rows, start=1):
+            result = {'row': row_number, 'username': row.get('username', '')}
+            results.append(result)
+            
+            missing = [field for field in required_fields if not str(row.get(field) or '').strip()]
+            if missing:
+                result.update(status='error', error=f"Missing required fields: {', '.join(missing)}")
+                continue
+            
+            username = str(row['username']).strip()
+            email = str(row['email']).strip()
+            if username in seen_usernames:
+                result.update(status='error', error="Username already exists")
+                continue
+            if email in seen_emails:
+                result.update(status='error', error="Email already exists")
+                continue
+            seen_usernames.add(username)
+            seen_emails.add(email)
+            
+            user_item = {
+                'id': str(uuid.uuid4().int)[:10],
+                'username': username,
+                'email': email,
+                'first_name': str(row['first_name']).strip(),
+                'last_name': str(row['last_name']).strip(),
+                'created_at': current_time,
+                'updated_at': None,
+                'is_active': True
+            }
+            result.update(status='created', id=int(user_item['id']))
+            pending.append({
+                'result': result,
+                'id': user_item['id'],
+                'items': [
+                    user_item,
+                    self._sentinel_item(USERNAME_SENTINEL_PREFIX, username, user_item['id']),
+                    self._sentinel_item(EMAIL_SENTINEL_PREFIX, email, user_item['id'])
+                ]
+            })
+        
+        pending = self._drop_taken_identities(pending)
+        
+        users_per_batch = BATCH_WRITE_MAX_ITEMS // 3
+        chunks = [pending[i:i + users_per_batch]
+                  for i in range(0, len(pending), users_per_batch)]
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_in_flight),
+                                thread_name_prefix='user-import') as executor:
+            in_flight = {}
+            for chunk in chunks:
+                # Backpressure: wait for a slot before submitting the next batch
+                if len(in_flight) >= max_in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._record_bulk_outcome(in_flight.pop(future), future)
+                items = [item for entry in chunk for item in entry['items']]
+                future = executor.submit(self._batch_write, items)
+                in_flight[future] = chunk
+            
+            for future in list(in_flight):
+                self._record_bulk_outcome(in_flight.pop(future), future)
+        
+        return results
+    
+    def _drop_taken_identities(self, pending: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Reject pending rows whose username or email sentinel already exists."""
+        sentinel_ids = [item['id'] for entry in pending for item in entry['items'][1:]]
+        taken = set()
+        
+        try:
+            for start in range(0, len(sentinel_ids), BATCH_GET_MAX_KEYS):
+                keys = [{'id': sentinel_id}
+                        for sentinel_id in sentinel_ids[start:start + BATCH_GET_MAX_KEYS]]
+                taken.update(item['id'] for item in self._batch_get(keys))
+        except ClientError as e:
+            print(f"DynamoDB error checking existing users: {e}")
+            raise Exception(f"Failed to import users: {str(e)}")
+        
+        available = []
+        for entry in pending:
+            username_sentinel, email_sentinel = entry['items'][1]['id'], entry['items'][2]['id']
+            if username_sentinel in taken:
+                error = "Username already exists"
+            elif email_sentinel in taken:
+                error = "Email already exists"
+            else:
+                available.append(entry)
+                continue
+            entry['result'].pop('id', None)
+            entry['result'].update(status='error', error=error)
+        return available
+    
+    @staticmethod
+    def _record_bulk_outcome(chunk: List[Dict[str, Any]], future) -> None:
+        """Mark rows of a finished batch that could not be written as errors."""
+        try:
+            # Sentinels point at their user through user_id
+            unprocessed_ids = {item.get('user_id', item['id']) for item in future.result()}
+            error = "Write throttled; retry later"
+        except ClientError as e:
+            print(f"DynamoDB error bulk creating users: {e}")
+            unprocessed_ids = {entry['id'] for entry in chunk}
+            error = f"Failed to create user: {str(e)}"
+        
+        for entry in chunk:
+            if entry['id'] in unprocessed_ids:
+                entry['result'].pop('id', None)
+                entry['result'].update(status='error', error=error)
+    
+    def _batch_write(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Put items with BatchWriteItem, retrying unprocessed ones with backoff.
+        
+        Returns the items that were still unprocessed after the retry budget.
+        """
+        request_items = {self.table_name: [{'PutRequest': {'Item': item}} for item in items]}
+        
+        for attempt in range(BATCH_MAX_RETRIES + 1):
+            if attempt:
+                time.sleep(BATCH_BACKOFF_BASE * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5))
+            
+            response = self.dynamodb.batch_write_item(RequestItems=request_items)
+            request_items = response.get('UnprocessedItems') or {}
+            if not request_items:
+                return []
+        
+        return [request['PutRequest']['Item'] for request in request_items.get(self.table_name, [])]
+    
+    def get_all_users(self, total_segments: int = 1) -> List[Dict[str, Any]]:
+        """Get all users from DynamoDB.
+        
+        With ``total_segments`` > 1 the table is read by a parallel
+        segmented scan (see ``scan_users_parallel``).
+        """
+        if total_segments > 1:
+            return list(self.scan_users_parallel(total_segments=total_segments))
+        
         try:
-            response = self.table.scan()
+            response = self.table.scan(FilterExpression=USER_RECORDS_FILTER)
             items = response.get('Items', [])
             
             # Handle pagination if needed
             while 'LastEvaluatedKey' in response:
-                response = self.table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
+                response = self.table.scan(
+                    FilterExpression=USER_RECORDS_FILTER,
+                    ExclusiveStartKey=response['LastEvaluatedKey']
+                )
                 items.extend(response.get('Items', []))
             
             return [self.to_dict(item) for item in items]
@@ -108,22 +393,172 @@ class DynamoDBUser:
             print(f"DynamoDB error getting all users: {e}")
             raise Exception(f"Failed to get users: {str(e)}")
     
+    def scan_users_parallel(self, total_segments: int = DEFAULT_SCAN_SEGMENTS,
+                            max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield every user using a parallel segmented scan.
+        
+        The table is split into ``total_segments`` segments which are scanned
+        concurrently on a pool of at most ``max_workers`` threads. Pages are
+        handed to the caller through a bounded queue, so memory stays flat and
+        slow consumers apply backpressure to the scanning threads. Users are
+        yielded in page-arrival order, not table order.
+        """
+        if total_segments < 1 or total_segments > MAX_SCAN_SEGMENTS:
+            raise ValueError(f"total_segments must be between 1 and {MAX_SCAN_SEGMENTS}")
+        workers = min(max_workers or total_segments, total_segments)
+        
+        pages: queue.Queue = queue.Queue(maxsize=SCAN_QUEUE_PAGES)
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='user-scan')
+        
+        try:
+            for segment in range(total_segments):
+                executor.submit(self._scan_segment, segment, total_segments, pages, stop)
+            
+            remaining = total_segments
+            while remaining:
+                page = pages.get()
+                if page is _SEGMENT_DONE:
+                    remaining -= 1
+                elif isinstance(page, Exception):
+                    raise page
+                else:
+                    for item in page:
+                        yield self.to_dict(item)
+        finally:
+            # Unblock producers if the caller stopped early or a segment failed
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _scan_segment(self, segment: int, total_segments: int,
+                      pages: queue.Queue, stop: threading.Event) -> None:
+        """Scan one segment, feeding raw pages into the shared queue."""
+        def put(value) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(value, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        scan_kwargs = {
+            'Segment': segment,
+            'TotalSegments': total_segments,
+            'FilterExpression': USER_RECORDS_FILTER
+        }
+        try:
+            while not stop.is_set():
+                response = self.table.scan(**scan_kwargs)
+                if not put(response.get('Items', [])):
+                    return
+                if 'LastEvaluatedKey' not in response:
+                    break
+                scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            put(_SEGMENT_DONE)
+        except ClientError as e:
+            print(f"DynamoDB error scanning segment {segment}/{total_segments}: {e}")
+            put(Exception(f"Failed to get users: {str(e)}"))
+        except Exception as e:
+            print(f"Error scanning segment {segment}/{total_segments}: {e}")
+            put(e)
+    
+    def get_users_page(self, limit: int = DEFAULT_PAGE_SIZE,
+                       cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Get one page of users and a signed cursor for the next page."""
+        try:
+            scan_kwargs = {'Limit': limit, 'FilterExpression': USER_RECORDS_FILTER}
+            start_key = decode_cursor(cursor)
+            if start_key:
+                scan_kwargs['ExclusiveStartKey'] = start_key
+            
+            response = self.table.scan(**scan_kwargs)
+            
+            return {
+                'items': [self.to_dict(item) for item in response.get('Items', [])],
+                'next_cursor': encode_cursor(response.get('LastEvaluatedKey'))
+            }
+            
+        except ClientError as e:
+            print(f"DynamoDB error getting users page: {e}")
+            raise Exception(f"Failed to get users: {str(e)}")
+    
     def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Get user by ID from DynamoDB."""
+        """Get user by ID from DynamoDB (read-through cached)."""
+        cached = self._cached_user('id', str(user_id))
+        if cached is not None:
+            return cached
+        
         try:
             response = self.table.get_item(Key={'id': str(user_id)})
             item = response.get('Item')
             
             if item:
-                return self.to_dict(item)
+                user = self.to_dict(item)
+                self._cache_user(user)
+                return dict(user)
             return None
             
         except ClientError as e:
             print(f"DynamoDB error getting user by ID: {e}")
             raise Exception(f"Failed to get user: {str(e)}")
     
+    def get_users_by_ids(self, user_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get many users by ID with BatchGetItem.
+        
+        Returns one entry per requested ID in the caller's order, with None
+        for IDs that do not exist. Cached users are served without a read and
+        the rest are fetched in chunks of BATCH_GET_MAX_KEYS keys.
+        """
+        wanted = [str(user_id) for user_id in user_ids]
+        found: Dict[str, Dict[str, Any]] = {}
+        to_fetch = []
+        
+        for user_id in dict.fromkeys(wanted):
+            cached = self._cached_user('id', user_id)
+            if cached is not None:
+                found[user_id] = cached
+            else:
+                to_fetch.append(user_id)
+        
+        try:
+            for start in range(0, len(to_fetch), BATCH_GET_MAX_KEYS):
+                keys = [{'id': user_id} for user_id in to_fetch[start:start + BATCH_GET_MAX_KEYS]]
+                for item in self._batch_get(keys):
+                    user = self.to_dict(item)
+                    self._cache_user(user)
+                    found[str(item['id'])] = user
+            
+        except ClientError as e:
+            print(f"DynamoDB error batch getting users: {e}")
+            raise Exception(f"Failed to get users: {str(e)}")
+        
+        return [dict(found[user_id]) if user_id in found else None for user_id in wanted]
+    
+    def _batch_get(self, keys: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run one BatchGetItem, retrying UnprocessedKeys with exponential backoff."""
+        request_items = {self.table_name: {'Keys': keys}}
+        items: List[Dict[str, Any]] = []
+        
+        for attempt in range(BATCH_MAX_RETRIES + 1):
+            if attempt:
+                time.sleep(BATCH_BACKOFF_BASE * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5))
+            
+            response = self.dynamodb.batch_get_item(RequestItems=request_items)
+            items.extend(response.get('Responses', {}).get(self.table_name, []))
+            
+            request_items = response.get('UnprocessedKeys') or {}
+            if not request_items:
+                return items
+        
+        raise Exception("Failed to get users: unprocessed keys remained after retries")
+    
     def get_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
-        """Get user by username using GSI."""
+        """Get user by username using GSI (read-through cached)."""
+        cached = self._cached_user('username', username)
+        if cached is not None:
+            return cached
+        
         try:
             response = self.table.query(
                 IndexName='username-index',
@@ -133,7 +568,9 @@ class DynamoDBUser:
             
             items = response.get('Items', [])
             if items:
-                return self.to_dict(items[0])
+                user = self.to_dict(items[0])
+                self._cache_user(user)
+                return dict(user)
             return None
             
         except ClientError as e:
@@ -141,7 +578,11 @@ class DynamoDBUser:
             raise Exception(f"Failed to get user: {str(e)}")
     
     def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
-        """Get user by email using GSI."""
+        """Get user by email using GSI (read-through cached)."""
+        cached = self._cached_user('email', email)
+        if cached is not None:
+            return cached
+        
         try:
             response = self.table.query(
                 IndexName='email-index',
@@ -151,7 +592,9 @@ class DynamoDBUser:
             
             items = response.get('Items', [])
             if items:
-                return self.to_dict(items[0])
+                user = self.to_dict(items[0])
+                self._cache_user(user)
+                return dict(user)
             return None
             
         except ClientError as e:
@@ -175,11 +618,10 @@ class DynamoDBUser:
                     update_expression += f", {key} = :{key}"
                     expression_values[f":{key}"] = value
             
-            # Check email uniqueness if updating email
+            # Email changes move the email sentinel in the same transaction
             if 'email' in kwargs and kwargs['email'] != existing_user['email']:
-                existing_email_user = self.get_user_by_email(kwargs['email'])
-                if existing_email_user and existing_email_user['id'] != int(user_id):
-                    raise ValueError("Email already exists")
+                return self._update_user_email(user_id, existing_user, kwargs,
+                                               update_expression, expression_values)
             
             # Update item
             response = self.table.update_item(
@@ -188,6 +630,8 @@ class DynamoDBUser:
                 ExpressionAttributeValues=expression_values,
                 ReturnValues='ALL_NEW'
             )
+            self.invalidate_user(user_id, username=existing_user.get('username'),
+                                 email=existing_user.get('email'))
             
             return self.to_dict(response['Attributes'])
             
@@ -198,16 +642,72 @@ class DynamoDBUser:
             print(f"Error updating user: {e}")
             raise e
     
+    def _update_user_email(self, user_id: str, existing_user: Dict[str, Any],
+                           changes: Dict[str, Any], update_expression: str,
+                           expression_values: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply an update that changes the email, moving its sentinel atomically."""
+        old_email = existing_user.get('email', '')
+        new_email = changes['email']
+        
+        transact_items = [
+            {
+                'Update': {
+                    'TableName': self.table_name,
+                    'Key': {'id': str(user_id)},
+                    'UpdateExpression': update_expression,
+                    'ConditionExpression': 'attribute_exists(id) AND email = :old_email',
+                    'ExpressionAttributeValues': {**expression_values, ':old_email': old_email}
+                }
+            },
+            self._put_sentinel(EMAIL_SENTINEL_PREFIX, new_email, user_id)
+        ]
+        conflict_errors = ["User was modified concurrently, please retry", "Email already exists"]
+        if old_email:
+            transact_items.append(self._delete_sentinel(EMAIL_SENTINEL_PREFIX, old_email))
+            conflict_errors.append(None)
+        
+        try:
+            self._transact_write(transact_items, conflict_errors)
+        finally:
+            self.invalidate_user(user_id, username=existing_user.get('username'),
+                                 email=old_email)
+        
+        # Transactions cannot return the new item, so apply the changes locally
+        updated_user = dict(existing_user)
+        for key in ['first_name', 'last_name', 'email', 'is_active']:
+            if key in changes:
+                updated_user[key] = changes[key]
+        updated_user['updated_at'] = expression_values[':updated_at']
+        return updated_user
+    
     def delete_user(self, user_id: str) -> bool:
-        """Delete user from DynamoDB."""
+        """Delete user and its uniqueness sentinels from DynamoDB."""
         try:
             # Check if user exists
             existing_user = self.get_user_by_id(user_id)
             if not existing_user:
                 raise ValueError("User not found")
             
-            # Delete item
-            self.table.delete_item(Key={'id': str(user_id)})
+            # Delete item together with its sentinels
+            transact_items = [{
+                'Delete': {
+                    'TableName': self.table_name,
+                    'Key': {'id': str(user_id)},
+                    'ConditionExpression': 'attribute_exists(id)'
+                }
+            }]
+            if existing_user.get('username'):
+                transact_items.append(
+                    self._delete_sentinel(USERNAME_SENTINEL_PREFIX, existing_user['username']))
+            if existing_user.get('email'):
+                transact_items.append(
+                    self._delete_sentinel(EMAIL_SENTINEL_PREFIX, existing_user['email']))
+            
+            try:
+                self._transact_write(transact_items, ["User not found"])
+            finally:
+                self.invalidate_user(user_id, username=existing_user.get('username'),
+                                     email=existing_user.get('email'))
             return True
             
         except ClientError as e:
@@ -238,11 +738,20 @@ class DynamoDBUser:
                 'is_active': True,
                 'oauth_provider': oauth_provider,
                 'oauth_id': oauth_id,
+                'oauth_key': make_oauth_key(oauth_provider, oauth_id),
                 'profile_picture': profile_picture
             }
             
-            # Put item in DynamoDB
-            self.table.put_item(Item=user_item)
+            # Write user and uniqueness sentinels atomically
+            self._transact_write(
+                [
+                    self._put_new_user(user_item),
+                    self._put_sentinel(USERNAME_SENTINEL_PREFIX, username, user_id),
+                    self._put_sentinel(EMAIL_SENTINEL_PREFIX, email, user_id)
+                ],
+                [None, "Username already exists", "Email already exists"]
+            )
+            self.invalidate_user(user_id, username=username, email=email)
             
             return self.to_dict(user_item)
             
@@ -254,14 +763,12 @@ class DynamoDBUser:
             raise e
     
     def get_user_by_oauth_id(self, provider: str, oauth_id: str) -> Optional[Dict[str, Any]]:
-        """Get user by OAuth provider and ID."""
+        """Get user by OAuth provider and ID using the oauth_key GSI."""
         try:
-            response = self.table.scan(
-                FilterExpression='oauth_provider = :provider AND oauth_id = :oauth_id',
-                ExpressionAttributeValues={
-                    ':provider': provider,
-                    ':oauth_id': oauth_id
-                }
+            response = self.table.query(
+                IndexName=OAUTH_KEY_INDEX,
+                KeyConditionExpression='oauth_key = :oauth_key',
+                ExpressionAttributeValues={':oauth_key': make_oauth_key(provider, oauth_id)}
             )
             
             items = response.get('Items', [])
@@ -276,10 +783,12 @@ class DynamoDBUser:
     def link_oauth_account(self, user_id: str, provider: str, oauth_id: str) -> Dict[str, Any]:
         """Link OAuth account to existing user."""
         try:
-            update_expression = "SET oauth_provider = :provider, oauth_id = :oauth_id, updated_at = :updated_at"
+            update_expression = ("SET oauth_provider = :provider, oauth_id = :oauth_id, "
+                                 "oauth_key = :oauth_key, updated_at = :updated_at")
             expression_values = {
                 ':provider': provider,
                 ':oauth_id': oauth_id,
+                ':oauth_key': make_oauth_key(provider, oauth_id),
                 ':updated_at': datetime.utcnow().isoformat()
             }
             
@@ -289,6 +798,7 @@ class DynamoDBUser:
                 ExpressionAttributeValues=expression_values,
                 ReturnValues='ALL_NEW'
             )
+            self.invalidate_user(user_id)
             
             return self.to_dict(response['Attributes'])
             
@@ -296,5 +806,85 @@ class DynamoDBUser:
             print(f"DynamoDB error linking OAuth account: {e}")
             raise Exception(f"Failed to link OAuth account: {str(e)}")
 
+    def backfill_oauth_keys(self) -> int:
+        """Populate oauth_key on users linked before the OAuth GSI existed.
+        
+        Safe to re-run: only rows with an OAuth identity and no oauth_key are
+        touched. Returns the number of users updated.
+        """
+        try:
+            scan_kwargs = {
+                'FilterExpression': 'attribute_exists(oauth_id) AND attribute_not_exists(oauth_key)',
+                'ProjectionExpression': 'id, oauth_provider, oauth_id'
+            }
+            updated = 0
+            
+            while True:
+                response = self.table.scan(**scan_kwargs)
+                
+                for item in response.get('Items', []):
+                    provider = item.get('oauth_provider')
+                    oauth_id = item.get('oauth_id')
+                    if not provider or not oauth_id:
+                        continue
+                    
+                    self.table.update_item(
+                        Key={'id': item['id']},
+                        UpdateExpression='SET oauth_key = :oauth_key',
+                        ConditionExpression='attribute_exists(id)',
+                        ExpressionAttributeValues={':oauth_key': make_oauth_key(provider, oauth_id)}
+                    )
+                    updated += 1
+                
+                if 'LastEvaluatedKey' not in response:
+                    break
+                scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            
+            return updated
+            
+        except ClientError as e:
+            print(f"DynamoDB error backfilling OAuth keys: {e}")
+            raise Exception(f"Failed to backfill OAuth keys: {str(e)}")
+
+    def backfill_unique_sentinels(self) -> int:
+        """Create username/email sentinels for users created before they existed.
+        
+        Safe to re-run; existing sentinels are overwritten with the same
+        owner. Returns the number of users processed.
+        """
+        try:
+            scan_kwargs = {
+                'FilterExpression': USER_RECORDS_FILTER,
+                'ProjectionExpression': 'id, username, email'
+            }
+            processed = 0
+            
+            while True:
+                response = self.table.scan(**scan_kwargs)
+                
+                sentinels = []
+                for item in response.get('Items', []):
+                    if item.get('username'):
+                        sentinels.append(self._sentinel_item(
+                            USERNAME_SENTINEL_PREFIX, item['username'], item['id']))
+                    if item.get('email'):
+                        sentinels.append(self._sentinel_item(
+                            EMAIL_SENTINEL_PREFIX, item['email'], item['id']))
+                    processed += 1
+                
+                for start in range(0, len(sentinels), BATCH_WRITE_MAX_ITEMS):
+                    if self._batch_write(sentinels[start:start + BATCH_WRITE_MAX_ITEMS]):
+                        raise Exception("Failed to backfill sentinels: writes were throttled")
+                
+                if 'LastEvaluatedKey' not in response:
+                    break
+                scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            
+            return processed
+            
+        except ClientError as e:
+            print(f"DynamoDB error backfilling uniqueness sentinels: {e}")
+            raise Exception(f"Failed to backfill sentinels: {str(e)}")
+
 # Global instance for use in Flask routes
 db_user = DynamoDBUser()
@@ -0,0 +1,79 @@
+"""
+Tests for the in-process TTL/LRU cache.
+"""
+
+import pytest
+
+from src.utils.cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Test class for TTLCache."""
+
+    def test_hit_and_miss_counters(self):
+        """Test that gets are counted as hits or misses."""
+        cache = TTLCache(max_size=2, ttl=10)
+        cache.set('a', 1)
+        
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['size'] == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = TTLCache(max_size=2, ttl=10)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')  # 'b' is now least recently used
+        cache.set('c', 3)
+        
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert cache.stats()['evictions'] == 1
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after the TTL."""
+        clock = FakeClock()
+        cache = TTLCache(max_size=10, ttl=5, clock=clock)
+        cache.set('a', 1)
+        
+        clock.now = 4.9
+        assert cache.get('a') == 1
+        clock.now = 5.0
+        assert cache.get('a') is None
+        assert cache.stats()['expirations'] == 1
+        assert len(cache) == 0
+
+    def test_delete_and_peek(self):
+        """Test that peek does not count and delete removes the entry."""
+        cache = TTLCache(max_size=10, ttl=10)
+        cache.set('a', 1)
+        
+        assert cache.peek('a') == 1
+        cache.delete('a')
+        cache.delete('missing')
+        assert cache.peek('a') is None
+        assert cache.stats()['hits'] == 0
+
+    def test_zero_size_disables_cache(self):
+        """Test that max_size=0 never stores anything."""
+        cache = TTLCache(max_size=0, ttl=10)
+        cache.set('a', 1)
+        
+        assert cache.get('a') is None
+        assert len(cache) == 0
@@ -512,3 +512,363 @@ class TestDynamoDBUser:
         assert 'first_name = :first_name' in update_expression
         assert 'invalid_field' not in update_expression
         assert result == {'id': 123}
+
+    def test_get_users_page_first_page(self):
+        """Test fetching the first page of users returns a cursor."""
+        user_model = DynamoDBUser()
+        user_model.table = Mock()
+        user_model.table.scan.return_value = {
+            'Items': [{'id': '1', 'username': 'user1'}],
+            'LastEvaluatedKey': {'id': '1'}
+        }
+        
+        page = user_model.get_users_page(limit=1)
+        
+        user_model.table.scan.assert_called_once_with(Limit=1)
+        assert [user['id'] for user in page['items']] == [1]
+        assert page['next_cursor'] is not None
+
+    def test_get_users_page_follows_cursor(self):
+        """Test that a cursor resumes the scan at the encoded key."""
+        user_model = DynamoDBUser()
+        user_model.table = Mock()
+        user_model.table.scan.side_effect = [
+            {'Items': [{'id': '1'}], 'LastEvaluatedKey': {'id': '1'}},
+            {'Items': [{'id': '2'}]}
+        ]
+        
+        first = user_model.get_users_page(limit=1)
+        second = user_model.get_users_page(limit=1, cursor=first['next_cursor'])
+        
+        user_model.table.scan.assert_called_with(Limit=1, ExclusiveStartKey={'id': '1'})
+        assert [user['id'] for user in second['items']] == [2]
+        assert second['next_cursor'] is None
+
+    def test_get_users_page_invalid_cursor(self):
+        """Test that a forged cursor is rejected before scanning."""
+        user_model = DynamoDBUser()
+        user_model.table = Mock()
+        
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            user_model.get_users_page(cursor='bogus.cursor')
+        user_model.table.scan.assert_not_called()
+
+    def test_scan_users_parallel_merges_segments(self):
+        """Test that every segment is scanned to completion and merged."""
+        user_model = DynamoDBUser()
+        user_model.table = Mock()
+        
+        def fake_scan(Segment, TotalSegments, ExclusiveStartKey=None):
+            if ExclusiveStartKey is None:
+                return {
+                    'Items': [{'id': f'{Segment}0'}],
+                    'LastEvaluatedKey': {'id': f'{Segment}0'}
+                }
+            return {'Items': [{'id': f'{Segment}1'}]}
+        
+        user_model.table.scan.side_effect = fake_scan
+        
+        result = list(user_model.scan_users_parallel(total_segments=3, max_workers=2))
+        
+        assert sorted(user['id'] for user in result) == [0, 1, 10, 11, 20, 21]
+        assert user_model.table.scan.call_count == 6
+        segments = {call.kwargs['Segment'] for call in user_model.table.scan.call_args_list}
+        assert segments == {0, 1, 2}
+
+    def test_scan_users_parallel_propagates_errors(self):
+        """Test that a failing segment surfaces as an exception to the caller."""
+        user_model = DynamoDBUser()
+        user_model.table = Mock()
+        
+        error_response = {'Error': {'Code': 'ProvisionedThroughputExceededException', 'Message': 'Slow down'}}
+        user_model.table.scan.side_effect = ClientError(error_response, 'Scan')
+        
+        with pytest.raises(Exception, match="Failed to get users"):
+            list(user_model.scan_users_parallel(total_segments=2))
+
+    def test_scan_users_parallel_invalid_segments(self):
+        """Test that an out-of-range segment count is rejected."""
+        user_model = DynamoDBUser()
+        
+        with pytest.raises(ValueError):
+            list(user_model.scan_users_parallel(total_segments=0))
+
+    def test_get_all_users_segmented(self):
+        """Test that get_all_users delegates to the parallel scan when segmented."""
+        user_model = DynamoDBUser()
+        user_model.scan_users_parallel = Mock(return_value=iter([{'id': 1}, {'id': 2}]))
+        
+        result = user_model.get_all_users(total_segments=4)
+        
+        user_model.scan_users_parallel.assert_called_once_with(total_segments=4)
+        assert result == [{'id': 1}, {'id': 2}]
+
+    def test_get_user_by_oauth_id_uses_index(self):
+        """Test that OAuth lookups are a single GSI query, not a scan."""
+        user_model = DynamoDBUser()
+        user_model.table = Mock()
+        user_model.table.query.return_value = {
+            'Items': [{'id': '123', 'oauth_provider': 'google', 'oauth_id': 'g-1'}]
+        }
+        
+        result = user_model.get_user_by_oauth_id('google', 'g-1')
+        
+        user_model.table.query.assert_called_once_with(
+            IndexName='oauth-key-index',
+            KeyConditionExpression='oauth_key = :oauth_key',
+            ExpressionAttributeValues={':oauth_key': 'google#g-1'}
+        )
+        user_model.table.scan.assert_not_called()
+        assert result['id'] == 123
+        assert result['oauth_id'] == 'g-1'
+
+    def test_link_oauth_account_sets_oauth_key(self):
+        """Test that linking an account keeps oauth_key in sync."""
+        user_model = DynamoDBUser()
+        user_model.table = Mock()
+        user_model.table.update_item.return_value = {'Attributes': {'id': '123'}}
+        
+        user_model.link_oauth_account('123', 'google', 'g-1')
+        
+        update_call = user_model.table.update_item.call_args[1]
+        assert 'oauth_key = :oauth_key' in update_call['UpdateExpression']
+        assert update_call['ExpressionAttributeValues'][':oauth_key'] == 'google#g-1'
+
+    def test_backfill_oauth_keys(self):
+        """Test that the backfill pages through the table and sets oauth_key."""
+        user_model = DynamoDBUser()
+        user_model.table = Mock()
+        user_model.table.scan.side_effect = [
+            {
+                'Items': [{'id': '1', 'oauth_provider': 'google', 'oauth_id': 'g-1'}],
+                'LastEvaluatedKey': {'id': '1'}
+            },
+            {'Items': [
+                {'id': '2', 'oauth_provider': 'google', 'oauth_id': 'g-2'},
+                {'id': '3', 'oauth_provider': '', 'oauth_id': ''}
+            ]}
+        ]
+        
+        updated = user_model.backfill_oauth_keys()
+        
+        assert updated == 2
+        assert user_model.table.scan.call_count == 2
+        assert user_model.table.scan.call_args[1]['ExclusiveStartKey'] == {'id': '1'}
+        keys = [c[1]['ExpressionAttributeValues'][':oauth_key']
+                for c in user_model.table.update_item.call_args_list]
+        assert keys == ['google#g-1', 'google#g-2']
+
+    def test_get_user_by_id_cached(self):
+        """Test that repeated lookups are served from the cache under every key."""
+        user_model = DynamoDBUser()
+        user_model.table = Mock()
+        user_model.table.get_item.return_value = {
+            'Item': {'id': '123', 'username': 'testuser', 'email': 'test@example.com'}
+        }
+        
+        first = user_model.get_user_by_id('123')
+        second = user_model.get_user_by_id('123')
+        by_username = user_model.get_user_by_username('testuser')
+        by_email = user_model.get_user_by_email('test@example.com')
+        
+        user_model.table.get_item.assert_called_once()
+        user_model.table.query.assert_not_called()
+        assert first == second == by_username == by_email
+        assert user_model.cache_stats()['hits'] == 3
+
+    def test_cached_user_is_copied(self):
+        """Test that callers cannot mutate the cached entry."""
+        user_model = DynamoDBUser()
+        user_model.table = Mock()
+        user_model.table.get_item.return_value = {'Item': {'id': '123', 'username': 'testuser'}}
+        
+        user_model.get_user_by_id('123')['username'] = 'mutated'
+        
+        assert user_model.get_user_by_id('123')['username'] == 'testuser'
+
+    def test_update_user_invalidates_cache(self):
+        """Test that an update evicts the id, username and email keys."""
+        user_model = DynamoDBUser()
+        user_model.table = Mock()
+        user_model.table.get_item.return_value = {
+            'Item': {'id': '123', 'username': 'testuser', 'email': 'old@example.com'}
+        }
+        user_model.table.query.return_value = {'Items': []}
+        user_model.table.update_item.return_value = {
+            'Attributes': {'id': '123', 'username': 'testuser', 'email': 'new@example.com'}
+        }
+        
+        user_model.get_user_by_id('123')
+        user_model.update_user('123', email='new@example.com')
+        
+        assert user_model.cache.peek(('id', '123')) is None
+        assert user_model.cache.peek(('username', 'testuser')) is None
+        assert user_model.cache.peek(('email', 'old@example.com')) is None
+
+    def test_delete_user_invalidates_cache(self):
+        """Test that a deleted user is no longer served from the cache."""
+        user_model = DynamoDBUser()
+        user_model.table = Mock()
+        user_model.table.get_item.return_value = {
+            'Item': {'id': '123', 'username': 'testuser', 'email': 'test@example.com'}
+        }
+        
+        user_model.delete_user('123')
+        user_model.table.get_item.return_value = {}
+        
+        assert user_model.get_user_by_id('123') is None
+        assert user_model.cache.peek(('email', 'test@example.com')) is None
+
+    def test_link_oauth_account_invalidates_cache(self):
+        """Test that linking an OAuth account evicts the cached user."""
+        user_model = DynamoDBUser()
+        user_model.table = Mock()
+        user_model.table.get_item.return_value = {'Item': {'id': '123', 'username': 'testuser'}}
+        user_model.table.update_item.return_value = {'Attributes': {'id': '123'}}
+        
+        user_model.get_user_by_id('123')
+        user_model.link_oauth_account('123', 'google', 'g-1')
+        
+        assert user_model.cache.peek(('id', '123')) is None
+        assert user_model.cache.peek(('username', 'testuser')) is None
+
+    @patch('src.models.dynamodb_user.time.sleep')
+    def test_get_users_by_ids_chunks_and_orders(self, mock_sleep):
+        """Test that ids are chunked by 100 and returned in caller order."""
+        user_model = DynamoDBUser()
+        user_model.dynamodb = Mock()
+        table_name = user_model.table_name
+        
+        def fake_batch_get(RequestItems):
+            keys = RequestItems[table_name]['Keys']
+            # Return items reversed and drop id '5' to simulate a missing user
+            items = [dict(key) for key in reversed(keys) if key['id'] != '5']
+            return {'Responses': {table_name: items}}
+        
+        user_model.dynamodb.batch_get_item.side_effect = fake_batch_get
+        
+        ids = [str(i) for i in range(1, 151)]
+        result = user_model.get_users_by_ids(ids)
+        
+        assert user_model.dynamodb.batch_get_item.call_count == 2
+        chunk_sizes = [len(c[1]['RequestItems'][table_name]['Keys'])
+                       for c in user_model.dynamodb.batch_get_item.call_args_list]
+        assert chunk_sizes == [100, 50]
+        assert result[4] is None
+        assert [user['id'] for user in result if user] == [i for i in range(1, 151) if i != 5]
+        mock_sleep.assert_not_called()
+
+    @patch('src.models.dynamodb_user.time.sleep')
+    def test_get_users_by_ids_retries_unprocessed(self, mock_sleep):
+        """Test that UnprocessedKeys are retried with backoff."""
+        user_model = DynamoDBUser()
+        user_model.dynamodb = Mock()
+        table_name = user_model.table_name
+        user_model.dynamodb.batch_get_item.side_effect = [
+            {
+                'Responses': {table_name: [{'id': '1'}]},
+                'UnprocessedKeys': {table_name: {'Keys': [{'id': '2'}]}}
+            },
+            {'Responses': {table_name: [{'id': '2'}]}, 'UnprocessedKeys': {}}
+        ]
+        
+        result = user_model.get_users_by_ids(['2', '1', '2'])
+        
+        assert [user['id'] for user in result] == [2, 1, 2]
+        second_call = user_model.dynamodb.batch_get_item.call_args_list[1][1]
+        assert second_call['RequestItems'] == {table_name: {'Keys': [{'id': '2'}]}}
+        mock_sleep.assert_called_once()
+
+    @patch('src.models.dynamodb_user.time.sleep')
+    def test_get_users_by_ids_gives_up(self, mock_sleep):
+        """Test that persistently unprocessed keys raise after the retry budget."""
+        user_model = DynamoDBUser()
+        user_model.dynamodb = Mock()
+        table_name = user_model.table_name
+        user_model.dynamodb.batch_get_item.return_value = {
+            'Responses': {},
+            'UnprocessedKeys': {table_name: {'Keys': [{'id': '1'}]}}
+        }
+        
+        with pytest.raises(Exception, match="unprocessed keys"):
+            user_model.get_users_by_ids(['1'])
+
+    def test_get_users_by_ids_uses_cache(self):
+        """Test that cached users skip the batch read."""
+        user_model = DynamoDBUser()
+        user_model.dynamodb = Mock()
+        user_model._cache_user({'id': 1, 'username': 'cached'})
+        
+        result = user_model.get_users_by_ids(['1'])
+        
+        user_model.dynamodb.batch_get_item.assert_not_called()
+        assert result == [{'id': 1, 'username': 'cached'}]
+
+    def test_bulk_create_users_batches_and_reports(self):
+        """Test that rows are written 25 at a time with a per-row report."""
+        user_model = DynamoDBUser()
+        user_model.dynamodb = Mock()
+        user_model.dynamodb.batch_write_item.return_value = {'UnprocessedItems': {}}
+        
+        rows = [
+            {'username': f'user{i}', 'email': f'user{i}@example.com',
+             'first_name': 'First', 'last_name': 'Last'}
+            for i in range(60)
+        ]
+        
+        results = user_model.bulk_create_users(rows, max_in_flight=2)
+        
+        assert user_model.dynamodb.batch_write_item.call_count == 3
+        batch_sizes = sorted(len(c[1]['RequestItems'][user_model.table_name])
+                             for c in user_model.dynamodb.batch_write_item.call_args_list)
+        assert batch_sizes == [10, 25, 25]
+        assert [result['row'] for result in results] == list(range(1, 61))
+        assert all(result['status'] == 'created' for result in results)
+
+    def test_bulk_create_users_validates_in_memory(self):
+        """Test that duplicates within the batch and missing fields are rejected."""
+        user_model = DynamoDBUser()
+        user_model.dynamodb = Mock()
+        user_model.dynamodb.batch_write_item.return_value = {'UnprocessedItems': {}}
+        
+        rows = [
+            {'username': 'alice', 'email': 'alice@example.com', 'first_name': 'A', 'last_name': 'L'},
+            {'username': 'alice', 'email': 'other@example.com', 'first_name': 'A', 'last_name': 'L'},
+            {'username': 'bob', 'email': 'alice@example.com', 'first_name': 'B', 'last_name': 'L'},
+            {'username': 'carol', 'email': 'carol@example.com'}
+        ]
+        
+        results = user_model.bulk_create_users(rows)
+        
+        assert [result['status'] for result in results] == ['created', 'error', 'error', 'error']
+        assert results[1]['error'] == 'Username already exists'
+        assert results[2]['error'] == 'Email already exists'
+        assert 'first_name' in results[3]['error']
+        written = user_model.dynamodb.batch_write_item.call_args[1]['RequestItems'][user_model.table_name]
+        assert len(written) == 1
+
+    @patch('src.models.dynamodb_user.time.sleep')
+    def test_bulk_create_users_unprocessed_items(self, mock_sleep):
+        """Test that unprocessed items are retried and reported if they never land."""
+        user_model = DynamoDBUser()
+        user_model.dynamodb = Mock()
+        table_name = user_model.table_name
+        
+        def throttle_bob(RequestItems):
+            stuck = [request for request in RequestItems[table_name]
+                     if request['PutRequest']['Item']['username'] == 'bob']
+            return {'UnprocessedItems': {table_name: stuck} if stuck else {}}
+        
+        user_model.dynamodb.batch_write_item.side_effect = throttle_bob
+        
+        rows = [
+            {'username': 'alice', 'email': 'alice@example.com', 'first_name': 'A', 'last_name': 'L'},
+            {'username': 'bob', 'email': 'bob@example.com', 'first_name': 'B', 'last_name': 'L'}
+        ]
+        
+        results = user_model.bulk_create_users(rows)
+        
+        assert results[0]['status'] == 'created'
+        assert results[1]['status'] == 'error'
+        assert 'id' not in results[1]
+        assert mock_sleep.call_count == 5
@@ -10,7 +10,9 @@ from src.utils.helpers import (
     save_json_file,
     load_csv_file,
     format_file_size,
-    ensure_directory_exists
+    ensure_directory_exists,
+    parse_csv_text,
+    parse_ndjson_text
 )
 
 
@@ -54,3 +56,22 @@ class TestHelpers:
         """Test loading non-existent files."""
         assert load_json_file("nonexistent.json") == {}
         assert load_csv_file("nonexistent.csv") == []
+    
+    def test_parse_csv_text(self):
+        """Test parsing CSV text with a header row."""
+        text = "username,email\n alice ,alice@example.com\nbob,bob@example.com\n"
+        
+        assert parse_csv_text(text) == [
+            {'username': 'alice', 'email': 'alice@example.com'},
+            {'username': 'bob', 'email': 'bob@example.com'}
+        ]
+    
+    def test_parse_ndjson_text(self):
+        """Test parsing NDJSON, skipping blank lines and rejecting bad lines."""
+        text = '{"username": "alice"}\n\n{"username": "bob"}\n'
+        assert parse_ndjson_text(text) == [{'username': 'alice'}, {'username': 'bob'}]
+        
+        with pytest.raises(ValueError, match="line 2"):
+            parse_ndjson_text('{"username": "alice"}\n{not json}')
+        with pytest.raises(ValueError, match="not a JSON object"):
+            parse_ndjson_text('[1, 2]')
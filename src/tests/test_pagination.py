@@ -0,0 +1,64 @@
+"""
+Tests for pagination cursor utilities.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.utils.pagination import (
+    encode_cursor,
+    decode_cursor,
+    parse_page_size,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE
+)
+
+
+class TestPagination:
+    """Test class for cursor encoding and page size parsing."""
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes back to the original key."""
+        key = {'id': '1234567890'}
+        cursor = encode_cursor(key)
+        
+        assert isinstance(cursor, str)
+        assert '1234567890' not in cursor
+        assert decode_cursor(cursor) == key
+
+    def test_empty_key_has_no_cursor(self):
+        """Test that an exhausted scan produces no cursor."""
+        assert encode_cursor(None) is None
+        assert encode_cursor({}) is None
+        assert decode_cursor(None) is None
+        assert decode_cursor('') is None
+
+    def test_tampered_cursor_rejected(self):
+        """Test that a modified cursor fails signature verification."""
+        cursor = encode_cursor({'id': '1'})
+        forged = encode_cursor({'id': '2'}).split('.')[0] + '.' + cursor.split('.')[1]
+        
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(forged)
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor('not-a-cursor')
+
+    def test_cursor_bound_to_secret_key(self):
+        """Test that cursors signed with another secret are rejected."""
+        with patch.dict('os.environ', {'SECRET_KEY': 'first'}):
+            cursor = encode_cursor({'id': '1'})
+        with patch.dict('os.environ', {'SECRET_KEY': 'second'}):
+            with pytest.raises(ValueError, match="Invalid cursor"):
+                decode_cursor(cursor)
+
+    def test_parse_page_size(self):
+        """Test limit parsing, defaults and clamping."""
+        assert parse_page_size(None) == DEFAULT_PAGE_SIZE
+        assert parse_page_size('') == DEFAULT_PAGE_SIZE
+        assert parse_page_size('10') == 10
+        assert parse_page_size(str(MAX_PAGE_SIZE + 1)) == MAX_PAGE_SIZE
+        
+        with pytest.raises(ValueError):
+            parse_page_size('abc')
+        with pytest.raises(ValueError):
+            parse_page_size('0')
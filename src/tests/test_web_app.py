@@ -6,8 +6,10 @@ import pytest
 import json
 import sys
 import os
+from unittest.mock import patch
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from web_app import create_app
+from src.models.dynamodb_user import DEFAULT_SCAN_SEGMENTS
 
 
 @pytest.fixture
@@ -206,3 +208,110 @@ class TestWebApp:
         
         data = json.loads(response.data)
         assert data['message'] == 'Logout successful'
+
+
+class TestUserPagination:
+    """Test class for the paginated user list endpoint."""
+
+    @patch('web_app.db_user')
+    def test_get_users_page_with_cursor(self, mock_db_user, client):
+        """Test that limit/cursor are passed through and the next cursor is returned."""
+        mock_db_user.get_users_page.return_value = {
+            'items': [{'id': 1, 'username': 'user1'}],
+            'next_cursor': 'next-token'
+        }
+        
+        response = client.get('/api/users?limit=1&cursor=abc')
+        
+        assert response.status_code == 200
+        assert json.loads(response.data) == [{'id': 1, 'username': 'user1'}]
+        assert response.headers['X-Next-Cursor'] == 'next-token'
+        mock_db_user.get_users_page.assert_called_once_with(limit=1, cursor='abc')
+        mock_db_user.get_all_users.assert_not_called()
+
+    @patch('web_app.db_user')
+    def test_get_users_invalid_limit(self, mock_db_user, client):
+        """Test that a bad limit is rejected with 400."""
+        response = client.get('/api/users?limit=zero')
+        
+        assert response.status_code == 400
+        mock_db_user.get_users_page.assert_not_called()
+
+    @patch('web_app.db_user')
+    def test_get_all_users_requires_admin_key(self, mock_db_user, client):
+        """Test that the unbounded list is only available with the admin key."""
+        mock_db_user.get_all_users.return_value = [{'id': 1}]
+        
+        with patch.dict(os.environ, {'ADMIN_API_KEY': 'secret'}):
+            denied = client.get('/api/users?all=true')
+            allowed = client.get('/api/users?all=true', headers={'X-Admin-Key': 'secret'})
+        
+        assert denied.status_code == 403
+        assert allowed.status_code == 200
+        assert json.loads(allowed.data) == [{'id': 1}]
+        mock_db_user.get_all_users.assert_called_once_with(total_segments=DEFAULT_SCAN_SEGMENTS)
+
+
+class TestBatchGetUsers:
+    """Test class for the batch user fetch endpoint."""
+
+    @patch('web_app.db_user')
+    def test_batch_get_users(self, mock_db_user, client):
+        """Test that found and missing ids are reported in request order."""
+        mock_db_user.get_users_by_ids.return_value = [{'id': 2}, None, {'id': 1}]
+        
+        response = client.post('/api/users/batch-get',
+                               data=json.dumps({'ids': ['2', '3', '1']}),
+                               content_type='application/json')
+        
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['users'] == [{'id': 2}, {'id': 1}]
+        assert data['not_found'] == ['3']
+        mock_db_user.get_users_by_ids.assert_called_once_with(['2', '3', '1'])
+
+    @patch('web_app.db_user')
+    def test_batch_get_users_validation(self, mock_db_user, client):
+        """Test that missing or oversized id lists are rejected."""
+        empty = client.post('/api/users/batch-get', data=json.dumps({}),
+                            content_type='application/json')
+        too_many = client.post('/api/users/batch-get',
+                               data=json.dumps({'ids': [str(i) for i in range(1001)]}),
+                               content_type='application/json')
+        
+        assert empty.status_code == 400
+        assert too_many.status_code == 400
+        mock_db_user.get_users_by_ids.assert_not_called()
+
+
+class TestBulkImportUsers:
+    """Test class for the bulk user import endpoint."""
+
+    @patch('web_app.db_user')
+    def test_bulk_import_csv(self, mock_db_user, client):
+        """Test that a CSV body is parsed and summarized."""
+        mock_db_user.bulk_create_users.return_value = [
+            {'row': 1, 'username': 'alice', 'status': 'created', 'id': 1},
+            {'row': 2, 'username': 'bob', 'status': 'error', 'error': 'Email already exists'}
+        ]
+        body = ("username,email,first_name,last_name\n"
+                "alice,alice@example.com,Alice,L\n"
+                "bob,alice@example.com,Bob,L\n")
+        
+        response = client.post('/api/users/bulk', data=body, content_type='text/csv')
+        
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['created'] == 1
+        assert data['failed'] == 1
+        rows = mock_db_user.bulk_create_users.call_args[0][0]
+        assert [row['username'] for row in rows] == ['alice', 'bob']
+
+    @patch('web_app.db_user')
+    def test_bulk_import_invalid_ndjson(self, mock_db_user, client):
+        """Test that malformed NDJSON is rejected with 400."""
+        response = client.post('/api/users/bulk', data='{"username": ',
+                               content_type='application/x-ndjson')
+        
+        assert response.status_code == 400
+        mock_db_user.bulk_create_users.assert_not_called()
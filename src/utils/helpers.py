@@ -4,6 +4,7 @@ Utility functions for common operations.
 
 import json
 import csv
+import io
 from typing import Any, Dict, List, Union
 from pathlib import Path
 
@@ -46,6 +47,31 @@ def load_csv_file(file_path: str) -> List[Dict[str, str]]:
         return []
 
 
+def parse_csv_text(text: str) -> List[Dict[str, str]]:
+    """Parse CSV text with a header row into a list of dictionaries."""
+    reader = csv.DictReader(io.StringIO(text))
+    return [
+        {key.strip(): (value or '').strip() for key, value in row.items() if key}
+        for row in reader
+    ]
+
+
+def parse_ndjson_text(text: str) -> List[Dict[str, Any]]:
+    """Parse newline-delimited JSON, one object per non-blank line."""
+    records = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON on line {line_number}: {e.msg}")
+        if not isinstance(record, dict):
+            raise ValueError(f"Line {line_number} is not a JSON object")
+        records.append(record)
+    return records
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
     if size_bytes == 0:
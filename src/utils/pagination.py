@@ -0,0 +1,81 @@
+"""
+Opaque continuation tokens for paginated DynamoDB reads.
+
+A cursor wraps a DynamoDB ``LastEvaluatedKey`` in URL-safe base64 and signs it
+with HMAC-SHA256 so clients cannot forge or tamper with the start key.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+from typing import Any, Dict, Optional
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def _signing_key() -> bytes:
+    """Return the secret used to sign cursors."""
+    return os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production').encode('utf-8')
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+
+def encode_cursor(last_evaluated_key: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Encode a LastEvaluatedKey as a signed, opaque cursor string."""
+    if not last_evaluated_key:
+        return None
+
+    payload = json.dumps(last_evaluated_key, separators=(',', ':'), sort_keys=True, default=str)
+    payload_bytes = payload.encode('utf-8')
+    signature = hmac.new(_signing_key(), payload_bytes, hashlib.sha256).digest()
+    return f"{_b64encode(payload_bytes)}.{_b64encode(signature)}"
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Decode and verify a cursor produced by encode_cursor."""
+    if not cursor:
+        return None
+
+    try:
+        payload_part, signature_part = cursor.split('.', 1)
+        payload_bytes = _b64decode(payload_part)
+        signature = _b64decode(signature_part)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+    expected = hmac.new(_signing_key(), payload_bytes, hashlib.sha256).digest()
+    if not hmac.compare_digest(signature, expected):
+        raise ValueError("Invalid cursor")
+
+    try:
+        key = json.loads(payload_bytes.decode('utf-8'))
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(key, dict):
+        raise ValueError("Invalid cursor")
+    return key
+
+
+def parse_page_size(value: Optional[str], default: int = DEFAULT_PAGE_SIZE) -> int:
+    """Parse a ``limit`` query parameter, clamped to MAX_PAGE_SIZE."""
+    if value is None or value == '':
+        return default
+
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("limit must be an integer")
+
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    return min(limit, MAX_PAGE_SIZE)
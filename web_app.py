@@ -5,13 +5,22 @@ DynamoDB-powered serverless architecture
 """
 
 import os
+import hmac
 import jwt
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from google.auth.transport import requests
 from google.oauth2 import id_token
-from src.models.dynamodb_user import db_user
+from src.models.dynamodb_user import db_user, DEFAULT_SCAN_SEGMENTS
 from src.models.dynamodb_todo import db_todo
+from src.utils.helpers import parse_csv_text, parse_ndjson_text
+from src.utils.pagination import parse_page_size
+
+# Upper bound on ids accepted by POST /api/users/batch-get
+MAX_BATCH_GET_IDS = 1000
+
+# Upper bound on rows accepted by POST /api/users/bulk
+MAX_BULK_IMPORT_ROWS = 5000
 
 def create_app():
     """Application factory pattern for serverless deployment."""
@@ -22,13 +31,19 @@ def create_app():
     
     # CORS configuration
     cors_origins = os.environ.get('CORS_ORIGINS', 'http://localhost:3000').split(',')
-    CORS(app, origins=cors_origins)
+    CORS(app, origins=cors_origins, expose_headers=['X-Next-Cursor'])
     
     # Register routes
     register_routes(app)
     
     return app
 
+def is_admin_request():
+    """Check the X-Admin-Key header against the configured ADMIN_API_KEY."""
+    admin_key = os.environ.get('ADMIN_API_KEY')
+    provided = request.headers.get('X-Admin-Key', '')
+    return bool(admin_key) and hmac.compare_digest(provided, admin_key)
+
 def register_routes(app):
     """Register all application routes."""
     
@@ -40,7 +55,8 @@ def register_routes(app):
             'message': 'Serverless API is running with OAuth',
             'version': '2.1.0',
             'architecture': 'AWS Lambda + DynamoDB + OAuth',
-            'oauth_enabled': True
+            'oauth_enabled': True,
+            'user_cache': db_user.cache_stats()
         })
     
     @app.route('/api/auth/google', methods=['POST'])
@@ -151,10 +167,29 @@ def register_routes(app):
     
     @app.route('/api/users', methods=['GET'])
     def get_users():
-        """Get all users from DynamoDB."""
+        """Get a page of users from DynamoDB.
+        
+        Pass the ``X-Next-Cursor`` response header back as ``cursor`` to get
+        the next page. A full-table read requires ``all=true`` together with
+        an ``X-Admin-Key`` header matching ``ADMIN_API_KEY``; it runs as a
+        parallel segmented scan with ``segments`` workers.
+        """
         try:
-            users = db_user.get_all_users()
-            return jsonify(users)
+            if request.args.get('all', '').lower() in ('true', '1', 'yes'):
+                if not is_admin_request():
+                    return jsonify({'error': 'Admin key required for unpaginated user list'}), 403
+                segments = request.args.get('segments', DEFAULT_SCAN_SEGMENTS, type=int)
+                return jsonify(db_user.get_all_users(total_segments=segments))
+            
+            limit = parse_page_size(request.args.get('limit'))
+            page = db_user.get_users_page(limit=limit, cursor=request.args.get('cursor'))
+            
+            response = jsonify(page['items'])
+            if page['next_cursor']:
+                response.headers['X-Next-Cursor'] = page['next_cursor']
+            return response
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         except Exception as e:
             return jsonify({
                 'error': 'Failed to fetch users',
@@ -193,6 +228,71 @@ def register_routes(app):
                 'details': str(e)
             }), 500
     
+    @app.route('/api/users/bulk', methods=['POST'])
+    def bulk_import_users():
+        """Bulk-create users from a CSV or NDJSON request body.
+        
+        The format comes from ``?format=csv|ndjson`` or the Content-Type
+        (``text/csv`` or ``application/x-ndjson``).
+        """
+        try:
+            import_format = request.args.get('format') or (
+                'csv' if request.mimetype == 'text/csv' else 'ndjson'
+            )
+            body = request.get_data(as_text=True)
+            
+            if import_format == 'csv':
+                rows = parse_csv_text(body)
+            elif import_format == 'ndjson':
+                rows = parse_ndjson_text(body)
+            else:
+                return jsonify({'error': 'format must be csv or ndjson'}), 400
+            
+            if not rows:
+                return jsonify({'error': 'No rows to import'}), 400
+            if len(rows) > MAX_BULK_IMPORT_ROWS:
+                return jsonify({'error': f'At most {MAX_BULK_IMPORT_ROWS} rows per request'}), 400
+            
+            results = db_user.bulk_create_users(rows)
+            created = sum(1 for result in results if result['status'] == 'created')
+            
+            return jsonify({
+                'created': created,
+                'failed': len(results) - created,
+                'results': results
+            }), 200
+            
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({
+                'error': 'Failed to import users',
+                'details': str(e)
+            }), 500
+    
+    @app.route('/api/users/batch-get', methods=['POST'])
+    def batch_get_users():
+        """Get many users by ID in as few DynamoDB round trips as possible."""
+        try:
+            data = request.get_json(silent=True) or {}
+            user_ids = data.get('ids')
+            
+            if not isinstance(user_ids, list) or not user_ids:
+                return jsonify({'error': 'ids must be a non-empty list'}), 400
+            if len(user_ids) > MAX_BATCH_GET_IDS:
+                return jsonify({'error': f'At most {MAX_BATCH_GET_IDS} ids per request'}), 400
+            
+            users = db_user.get_users_by_ids(user_ids)
+            return jsonify({
+                'users': [user for user in users if user is not None],
+                'not_found': [user_id for user_id, user in zip(user_ids, users) if user is None]
+            })
+        except Exception as e:
+            return jsonify({
+                'error': 'Failed to fetch users',
+                'details': str(e)
+            }), 500
+    
     @app.route('/api/users/<user_id>', methods=['GET'])
     def get_user(user_id):
         """Get a specific user by ID from DynamoDB."""